@@ -2,6 +2,16 @@ import cv2
 import mediapipe as mp
 import json
 import numpy as np
+import os
+import queue
+import sys
+import threading
+import time
+
+try:
+    from numba import njit  # Optional, compiles the landmark smoothing loop
+except ImportError:
+    njit = None
 
 
 """
@@ -29,6 +39,11 @@ Each landmark includes:
   • x, y, z     → normalized landmark coordinates (range ~0–1)
   • visibility  → landmark confidence (0–1)
 
+Setting AOS_SCHEMA = False switches to a compact columnar structure, where array
+position i is landmark id i (names as listed in POSE_LANDMARKS):
+    { "x": [0.71, ...], "y": [0.60, ...], "z": [-0.72, ...], "v": [0.99, ...] }
+The companion actor below expects the default per-landmark structure.
+
 NOTE: This JSON can be converted to Isadora’s Skeleton JSON format using a
 companion User Actor "DX - MediaPipe to Izzy Skeleton", which is present in the example file.
 
@@ -36,10 +51,29 @@ companion User Actor "DX - MediaPipe to Izzy Skeleton", which is present in the
 INCLUDED FUNCTIONALITY
 -------------------------------------------------------------------------------
   ✓ Uses the MediaPipe Pose model with:
+      - model_complexity         = 0 (lite)
       - min_detection_confidence = 0.5
       - min_tracking_confidence  = 0.5
+      - smooth_landmarks         = True
+    The lite model is roughly twice as fast as the default full model (1) with a small
+    loss of landmark precision, which suits live stage visuals. Set MODEL_COMPLEXITY to
+    1 (full) or 2 (heavy) if more accuracy is needed and the machine can keep up.
+  ✓ Optional ONNX Runtime backend (BACKEND = "onnx") running the MediaPipe Pose
+    landmark model from the OpenCV Model Zoo, with the same JSON output.
+    Requires `pip install onnxruntime` and the .onnx file next to this script.
+  ✓ Optional GPU resize / colour conversion via OpenCV OpenCL (USE_OPENCL)
+  ✓ Explicit OpenCV / ONNX Runtime thread counts (OPENCV_NUM_THREADS, ONNX_NUM_THREADS)
   ✓ Processes incoming frames as NumPy arrays (e.g., from Isadora’s live feed)
-  ✓ Converts BGR → RGB for MediaPipe
+  ✓ Downscales large frames (longest edge ≤ MAX_INPUT_SIZE) before processing
+  ✓ Converts BGR → RGB for MediaPipe (NumPy channel reversal, no cvtColor).
+    Setting STRICT_COLOR = False skips the conversion and feeds BGR frames directly; this saves
+    a pass over each frame, but its effect on landmark accuracy has not been measured.
+  ✓ Optional MediaPipe Tasks backend (BACKEND = "tasks") using PoseLandmarker,
+    which requires a pose_landmarker_*.task model file next to this script.
+  ✓ Extra exponential smoothing of the landmarks (SMOOTHING_ALPHA, 1.0 disables;
+    compiled with numba when it is installed)
+  ✓ Skips detection on alternate frames while the pose is confidently tracked
+      (DETECT_EVERY_N_FRAMES, REUSE_VISIBILITY_THRESHOLD)
   ✓ Returns both JSON data and a status message
   ✓ Includes built-in camera test block when run standalone (for debugging)
   ✓ Proper initialization and cleanup of the MediaPipe Pose instance
@@ -75,8 +109,11 @@ OUTPUT DETAILS
 NOTES
 -------------------------------------------------------------------------------
   • All coordinates are normalized to the input frame dimensions.
+  • Values are written with LANDMARK_DECIMALS (3) decimal places to keep the JSON compact.
   • Y values increase downward (image coordinates), consistent with MediaPipe.
   • This script can run standalone for testing, capturing from the default webcam.
+    The standalone test grabs frames on a background thread so camera reads overlap
+    with pose detection (see _capture_loop).
   • Designed for use inside Isadora’s Pythoner actor but portable to any Python environment.
 
 ===============================================================================
@@ -99,8 +136,113 @@ POSE_LANDMARKS = {
     27: "Left Ankle", 28: "Right Ankle", 29: "Left Heel", 30: "Right Heel",
     31: "Left Foot Index", 32: "Right Foot Index"
 }
+NUM_LANDMARKS = len(POSE_LANDMARKS)
+# Landmark names in index order, so lookups by index never hash into POSE_LANDMARKS.
+_POSE_NAMES = tuple(POSE_LANDMARKS[i] for i in range(NUM_LANDMARKS))
+
+# Number of decimals written for each landmark value. 3 decimals resolves about 1–2 px at 1080p
+# (0.001 of 1920 px is ~1.9 px, of 1080 px ~1.1 px), and roughly halves the JSON size (and Isadora's
+# parsing time) compared to full float precision. Raise it if finer precision is needed.
+LANDMARK_DECIMALS = 3
+
+# Output schema:
+#   True  → one object per landmark: {"pose": [{"id", "name", "x", "y", "z", "visibility"}, ...]}
+#           (the format expected by the current "DX - MediaPipe to Izzy Skeleton" actor)
+#   False → columnar arrays indexed by landmark id: {"x": [...33], "y": [...], "z": [...], "v": [...]}
+#           about 60% smaller and faster to parse, names are the POSE_LANDMARKS entries for each index
+AOS_SCHEMA = True
+
+# The output schema is fixed (33 ids and names), only the 4 floats per landmark change between frames.
+# The whole JSON text is therefore prebuilt once with a placeholder per float, and python_main
+# fills it with str.format, skipping per-frame dict construction and JSON encoding.
+_FLOAT_FIELD = '{:.%df}' % LANDMARK_DECIMALS
+if AOS_SCHEMA:
+    _JSON_TEMPLATE = '{{"pose":[' + ','.join(
+        f'{{{{"id":{i},"name":"{n}","x":{_FLOAT_FIELD},"y":{_FLOAT_FIELD},'
+        f'"z":{_FLOAT_FIELD},"visibility":{_FLOAT_FIELD}}}}}'
+        for i, n in enumerate(_POSE_NAMES)) + ']}}'
+    _EMPTY_JSON = '{"pose":[]}'
+else:
+    _JSON_TEMPLATE = '{{' + ','.join(
+        f'"{key}":[' + ','.join([_FLOAT_FIELD] * NUM_LANDMARKS) + ']'
+        for key in ("x", "y", "z", "v")) + '}}'
+    _EMPTY_JSON = '{"x":[],"y":[],"z":[],"v":[]}'
+
+# Frames are downscaled so their longest edge is at most this many pixels before being handed to MediaPipe.
+# The Pose model works on a 256x256 input internally, so larger frames only cost conversion time.
+# Landmarks are normalized (0–1), so no coordinate correction is needed after resizing.
+MAX_INPUT_SIZE = 512
+
+# Inference backend:
+#   "mediapipe" → MediaPipe Pose solution (default, no extra files needed)
+#   "tasks"     → MediaPipe Tasks PoseLandmarker (see TASKS_MODEL_PATH)
+#   "onnx"      → MediaPipe Pose landmark model run through ONNX Runtime (see ONNX_MODEL_PATH)
+BACKEND = "mediapipe"
+
+# MediaPipe expects RGB, so frames are converted from BGR before detection.
+# Set to False to skip the per-frame conversion and pass BGR frames as-is. This is faster, but the
+# impact on landmark accuracy has not been measured; check the results before using it in a show.
+STRICT_COLOR = True
+
+# MediaPipe Pose model: 0 = lite (fastest), 1 = full, 2 = heavy (most accurate)
+MODEL_COMPLEXITY = 0
+
+# PoseLandmarker model bundle for the Tasks backend, from
+# https://developers.google.com/mediapipe/solutions/vision/pose_landmarker (lite / full / heavy).
+# Relative paths are resolved against the folder containing this script.
+TASKS_MODEL_PATH = "pose_landmarker_lite.task"
+
+# ONNX export of the MediaPipe Pose landmark model from the OpenCV Model Zoo
+# (models/pose_estimation_mediapipe in https://github.com/opencv/opencv_zoo).
+# Relative paths are resolved against the folder containing this script.
+ONNX_MODEL_PATH = "pose_estimation_mediapipe_2023mar.onnx"
+ONNX_INPUT_SIZE = 256
+ONNX_CONFIDENCE_THRESHOLD = 0.5
+
+# Thread counts, set explicitly so throughput is reproducible and does not compete with Isadora's own threads.
+# OpenCV's per-frame work here (resize, copyMakeBorder/resize for the ONNX backend, cvtColor on the
+# OpenCL path) is small enough that it is cheaper single-threaded than waking a thread pool every frame.
+# The setting is process-wide, so python_finalize restores the previous value for other actors
+# sharing the interpreter.
+# ONNX Runtime uses one intra-op thread per core by default; on machines with more than 8 cores,
+# lowering ONNX_NUM_THREADS (e.g. to 4–8) often gives the same speed with less CPU load.
+# The MediaPipe solution API does not expose a thread setting for its TFLite interpreter.
+OPENCV_NUM_THREADS = 1
+ONNX_NUM_THREADS = os.cpu_count() or 0  # cpu_count() can return None; 0 lets ONNX Runtime choose
+
+# Run the resize (and the colour conversion when STRICT_COLOR is on) on the GPU through OpenCV's OpenCL
+# (T-API) path. Only worthwhile when an OpenCL GPU is present and not already busy rendering Isadora's
+# scene, so it is off by default. Ignored when OpenCV reports no OpenCL support.
+USE_OPENCL = False
+
+# Pose detection only runs on every Nth frame while the last detected pose is confidently tracked
+# (mean visibility above REUSE_VISIBILITY_THRESHOLD); the frames in between reuse the previous JSON.
+# This trades up to N-1 frames of latency for a matching cut in inference cost. Set to 1 to detect every frame.
+DETECT_EVERY_N_FRAMES = 2
+REUSE_VISIBILITY_THRESHOLD = 0.8
 
 pose = None  # Global variable to hold the MediaPipe Pose instance
+pose_landmarker = None  # Global variable to hold the PoseLandmarker when BACKEND = "tasks"
+onnx_session = None  # Global variable to hold the ONNX Runtime session when BACKEND = "onnx"
+_last_timestamp_ms = -1  # The Tasks video mode requires strictly increasing timestamps
+_use_opencl = False  # USE_OPENCL, confirmed against the OpenCV build in python_init
+_saved_opencv_threads = None  # OpenCV's thread count before python_init, restored in python_finalize
+_saved_use_opencl = None  # OpenCV's OpenCL setting before python_init, restored in python_finalize
+
+# Exponential smoothing applied to the landmarks after detection, on top of MediaPipe's own filter.
+# Each output is SMOOTHING_ALPHA * new + (1 - SMOOTHING_ALPHA) * previous; lower values are steadier
+# but lag more behind fast movement. Set to 1.0 to disable.
+SMOOTHING_ALPHA = 0.4
+
+_prev_lms = None  # Smoothed (33, 4) landmark array from the previous detection
+_in_buf = None  # Reused contiguous copy of strided input frames, reallocated only when the frame size changes
+_rgb_buf = None  # Reused RGB output buffer, reallocated only when the frame size changes
+
+# Cache of the last inference result, used to skip detection on confidently tracked frames
+_last_json = None
+_last_status = None
+_last_visibility_mean = 0.0
+_frame_counter = 0
 
 # python_init is called when the actor is first activated.
 def python_init(video_frame):
@@ -113,10 +255,192 @@ def python_init(video_frame):
     :type video_frame: Any
     :return: None
     :rtype: None
+
+    Inside Pythoner, frames are pushed in by Isadora so capture already overlaps with
+    detection. When feeding python_main from your own source instead, read frames on a
+    background producer thread into a size-1 queue that drops stale frames, and call
+    python_main on the consumer side (as the standalone test at the bottom of this file does).
     """
-    global pose
-    pose = mp.solutions.pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-    return  # No additional initialization required
+    global pose, pose_landmarker, onnx_session, _last_timestamp_ms, _use_opencl, _saved_opencv_threads, \
+        _saved_use_opencl
+    _saved_opencv_threads = cv2.getNumThreads()
+    cv2.setNumThreads(OPENCV_NUM_THREADS)
+    _use_opencl = USE_OPENCL and cv2.ocl.haveOpenCL()
+    if _use_opencl:
+        # OpenCV's OpenCL setting is shared with other actors in this interpreter, so it is
+        # only switched on when needed and restored in python_finalize
+        _saved_use_opencl = cv2.ocl.useOpenCL()
+        cv2.ocl.setUseOpenCL(True)
+    if BACKEND == "tasks":
+        options = mp.tasks.vision.PoseLandmarkerOptions(
+            base_options=mp.tasks.BaseOptions(model_asset_path=_model_path(TASKS_MODEL_PATH)),
+            running_mode=mp.tasks.vision.RunningMode.VIDEO,
+            num_poses=1,
+            min_pose_detection_confidence=0.5,
+            min_tracking_confidence=0.5)
+        pose_landmarker = mp.tasks.vision.PoseLandmarker.create_from_options(options)
+        _last_timestamp_ms = -1
+    elif BACKEND == "onnx":
+        import onnxruntime as ort  # Only required for the ONNX backend
+
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = ONNX_NUM_THREADS
+        opts.inter_op_num_threads = 1  # The model is a single sequential graph
+        onnx_session = ort.InferenceSession(_model_path(ONNX_MODEL_PATH), sess_options=opts, providers=["CPUExecutionProvider"])
+    else:
+        pose = mp.solutions.pose.Pose(model_complexity=MODEL_COMPLEXITY,
+                                      min_detection_confidence=0.5,
+                                      min_tracking_confidence=0.5,
+                                      smooth_landmarks=True,
+                                      static_image_mode=False)
+    # Compile the smoothing function now (when numba is installed) rather than on the first live frame
+    _smooth(np.zeros((NUM_LANDMARKS, 4), dtype=np.float32), np.zeros((NUM_LANDMARKS, 4), dtype=np.float32),
+            SMOOTHING_ALPHA)
+    # Run one dummy inference so the model's tensors are allocated now, not on the first live frame
+    _detect(np.zeros((256, 256, 3), dtype=np.uint8))
+    _reset_cache()
+    return
+
+def _model_path(path):
+    """
+    Resolves a model file path relative to the folder containing this script.
+
+    :param path: An absolute path, or a path relative to this script's folder.
+    :type path: str
+    :return: The absolute path to the model file.
+    :rtype: str
+    """
+    if os.path.isabs(path):
+        return path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+def _reset_cache():
+    """
+    Clears the cached result of the last pose inference and the smoothing state,
+    so the next frame is always processed from scratch.
+
+    :return: None
+    :rtype: None
+    """
+    global _prev_lms, _last_json, _last_status, _last_visibility_mean, _frame_counter
+    _prev_lms = None
+    _last_json = None
+    _last_status = None
+    _last_visibility_mean = 0.0
+    _frame_counter = 0
+
+def _smooth(prev, curr, alpha):
+    """
+    Blends the current landmarks into the previous ones in place (exponential moving average).
+    Compiled with numba when it is installed, otherwise runs as plain NumPy.
+
+    :param prev: The (33, 4) smoothed landmarks from the previous frame, updated in place.
+    :type prev: numpy.ndarray
+    :param curr: The (33, 4) landmarks detected in the current frame.
+    :type curr: numpy.ndarray
+    :param alpha: Weight of the current landmarks (0–1).
+    :type alpha: float
+    :return: None
+    :rtype: None
+    """
+    prev *= 1.0 - alpha
+    prev += alpha * curr
+
+if njit is not None:
+    _smooth = njit(_smooth)
+
+def _detect(image):
+    """
+    Runs pose detection on a frame with the backend selected by BACKEND.
+
+    :param image: A contiguous 3-channel uint8 image array.
+    :type image: numpy.ndarray
+    :return: A (33, 4) float32 array of x, y, z, visibility, or None if no pose was found.
+    :rtype: numpy.ndarray or None
+    """
+    if BACKEND == "tasks":
+        return _detect_tasks(image)
+    if BACKEND == "onnx":
+        return _detect_onnx(image)
+    return _detect_mediapipe(image)
+
+def _detect_mediapipe(image):
+    """
+    Runs the MediaPipe Pose solution on a frame.
+
+    :param image: A contiguous 3-channel image array.
+    :type image: numpy.ndarray
+    :return: A (33, 4) float32 array of x, y, z, visibility, or None if no pose was found.
+    :rtype: numpy.ndarray or None
+    """
+    results = pose.process(image)
+    if not results.pose_landmarks:
+        return None
+    # Read every protobuf field in one pass into a (33, 4) array of x, y, z, visibility
+    lms = results.pose_landmarks.landmark
+    return np.fromiter((v for lm in lms for v in (lm.x, lm.y, lm.z, lm.visibility)),
+                       dtype=np.float32, count=NUM_LANDMARKS * 4).reshape(NUM_LANDMARKS, 4)
+
+def _detect_tasks(image):
+    """
+    Runs the MediaPipe Tasks PoseLandmarker on a frame in video mode.
+
+    :param image: A contiguous 3-channel uint8 image array.
+    :type image: numpy.ndarray
+    :return: A (33, 4) float32 array of x, y, z, visibility, or None if no pose was found.
+    :rtype: numpy.ndarray or None
+    """
+    global _last_timestamp_ms
+    timestamp_ms = max(int(time.monotonic() * 1000), _last_timestamp_ms + 1)
+    _last_timestamp_ms = timestamp_ms
+    result = pose_landmarker.detect_for_video(mp.Image(image_format=mp.ImageFormat.SRGB, data=image), timestamp_ms)
+    if not result.pose_landmarks:
+        return None
+    lms = result.pose_landmarks[0]
+    return np.fromiter((v for lm in lms for v in (lm.x, lm.y, lm.z, lm.visibility)),
+                       dtype=np.float32, count=NUM_LANDMARKS * 4).reshape(NUM_LANDMARKS, 4)
+
+def _detect_onnx(image):
+    """
+    Runs the ONNX export of the MediaPipe Pose landmark model on a frame. The model expects RGB;
+    it receives whatever channel order STRICT_COLOR produces (RGB when True, BGR when False).
+
+    The landmark model expects a person-centred square crop. Without MediaPipe's separate
+    person detector, the whole frame is letterboxed to a square, which works best when the
+    performer fills most of the camera view (the usual stage setup).
+
+    :param image: A contiguous 3-channel image array.
+    :type image: numpy.ndarray
+    :return: A (33, 4) float32 array of x, y, z, visibility normalized to the frame,
+        or None if no pose was found.
+    :rtype: numpy.ndarray or None
+    """
+    h, w = image.shape[:2]
+    side = max(h, w)
+    pad_x = (side - w) // 2
+    pad_y = (side - h) // 2
+    square = cv2.copyMakeBorder(image, pad_y, side - h - pad_y, pad_x, side - w - pad_x,
+                                cv2.BORDER_CONSTANT, value=0)
+    blob = cv2.resize(square, (ONNX_INPUT_SIZE, ONNX_INPUT_SIZE), interpolation=cv2.INTER_AREA)
+    blob = blob.astype(np.float32)[np.newaxis] / 255.0  # NHWC, [0, 1]
+
+    outputs = onnx_session.run(None, {onnx_session.get_inputs()[0].name: blob})
+    # Outputs are landmarks (1, 195), pose score (1, 1), then mask, heatmap and world landmarks
+    raw = next(o for o in outputs if o.size == 195).reshape(-1, 5)
+    score = next(o for o in outputs if o.size == 1).item()
+    if score < ONNX_CONFIDENCE_THRESHOLD:
+        return None
+
+    # Rows are x, y, z in model input pixels then visibility and presence logits;
+    # only the first 33 of the 39 rows are pose landmarks, the rest are auxiliary ROI points.
+    raw = raw[:NUM_LANDMARKS]
+    px_scale = side / ONNX_INPUT_SIZE
+    arr = np.empty((NUM_LANDMARKS, 4), dtype=np.float32)
+    arr[:, 0] = (raw[:, 0] * px_scale - pad_x) / w
+    arr[:, 1] = (raw[:, 1] * px_scale - pad_y) / h
+    arr[:, 2] = raw[:, 2] * px_scale / w  # Same scale as x, as in MediaPipe's output
+    arr[:, 3] = 1.0 / (1.0 + np.exp(-raw[:, 3]))
+    return arr
 
 # python_main is called whenever an input value changes
 def python_main(video_frame):
@@ -131,40 +455,125 @@ def python_main(video_frame):
         error message, and a descriptive status message.
     :rtype: (str, str)
     """
-    if not isinstance(video_frame, np.ndarray) or video_frame.size == 0:
-        return json.dumps({"error": "Invalid input: Expected a non-empty NumPy image array"}), "Invalid or empty frame received"
+    # Pythoner always delivers a NumPy array (or None before the first frame arrives),
+    # so only the presence, shape and size of the frame are checked per call.
+    if video_frame is None or video_frame.ndim != 3 or video_frame.size == 0:
+        return json.dumps({"error": "Invalid input: Expected an HxWx3 NumPy image array"}), "Invalid or empty frame received"
+
+    global _prev_lms, _in_buf, _rgb_buf, _last_json, _last_status, _last_visibility_mean, _frame_counter
+    # Reuse the previous result in between detection frames while the pose is confidently tracked
+    _frame_counter += 1
+    if (_frame_counter % DETECT_EVERY_N_FRAMES != 0 and _last_json is not None
+            and _last_visibility_mean > REUSE_VISIBILITY_THRESHOLD):
+        return _last_json, _last_status
 
     try:
-        # Convert the frame to RGB for MediaPipe processing
-        rgb_frame = cv2.cvtColor(video_frame, cv2.COLOR_BGR2RGB)
-        results = pose.process(rgb_frame)
+        # Shrink large frames first so the channel swap and MediaPipe's own copy touch fewer bytes
+        scale = MAX_INPUT_SIZE / max(video_frame.shape[:2])
+        if _use_opencl and (scale < 1 or STRICT_COLOR):
+            # Resize and colour conversion run on the GPU via OpenCL; only the final result is downloaded
+            u = cv2.UMat(video_frame)
+            if scale < 1:
+                u = cv2.resize(u, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            if STRICT_COLOR:
+                u = cv2.cvtColor(u, cv2.COLOR_BGR2RGB)
+            video_frame = u.get()
+        elif scale < 1:
+            video_frame = cv2.resize(video_frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        if STRICT_COLOR and not _use_opencl:
+            # Convert the frame to RGB for MediaPipe processing.
+            # Reversing the channel axis is a single pass over memory and avoids cvtColor's thread pool.
+            # The reversed view is copied into a preallocated contiguous buffer (as MediaPipe requires)
+            # so no new H*W*3 array is allocated per frame.
+            if _rgb_buf is None or _rgb_buf.shape != video_frame.shape or _rgb_buf.dtype != video_frame.dtype:
+                _rgb_buf = np.empty(video_frame.shape, dtype=video_frame.dtype)
+            np.copyto(_rgb_buf, video_frame[..., ::-1])
+            video_frame = _rgb_buf
+        elif not video_frame.flags['C_CONTIGUOUS']:
+            # Isadora may pass strided views. OpenCV reads those directly, so only a frame that skipped
+            # the resize can still be strided here; copy it into a reused contiguous buffer for MediaPipe.
+            if _in_buf is None or _in_buf.shape != video_frame.shape or _in_buf.dtype != video_frame.dtype:
+                _in_buf = np.empty(video_frame.shape, dtype=video_frame.dtype)
+            np.copyto(_in_buf, video_frame)
+            video_frame = _in_buf
+
+        arr = _detect(video_frame)
     except cv2.error as e:
         return json.dumps({"error": "OpenCV error: " + str(e)}), "OpenCV processing error"
+    except ValueError as e:
+        return json.dumps({"error": "Frame conversion error: " + str(e)}), "Frame conversion error"
 
-    # Extract pose landmarks
-    if results.pose_landmarks:
-        landmarks = []
-        for idx, landmark in enumerate(results.pose_landmarks.landmark):
-            landmarks.append({
-                "id": idx,
-                "name": POSE_LANDMARKS[idx],
-                "x": landmark.x,
-                "y": landmark.y,
-                "z": landmark.z,
-                "visibility": landmark.visibility
-            })
-        return json.dumps({"pose": landmarks}), "Pose detected successfully"
+    if arr is not None:
+        if _prev_lms is None:
+            _prev_lms = arr  # Nothing to blend with on the first frame of a new pose
+        else:
+            _smooth(_prev_lms, arr, SMOOTHING_ALPHA)
+        arr = _prev_lms
+        # The AoS template takes the values landmark by landmark, the columnar one field by field
+        _last_json = _JSON_TEMPLATE.format(*(arr.ravel() if AOS_SCHEMA else arr.T.ravel()).tolist())
+        _last_status = "Pose detected successfully"
+        _last_visibility_mean = float(arr[:, 3].mean())
     else:
-        return json.dumps({"pose": []}), "No pose detected"
+        _last_json = _EMPTY_JSON
+        _last_status = "No pose detected"
+        _last_visibility_mean = 0.0
+        _prev_lms = None  # Don't blend a re-acquired pose with a stale one
+    return _last_json, _last_status
 
 # python_finalize is called just before the actor is deactivated
 def python_finalize():
-    global pose
+    global pose, pose_landmarker, onnx_session, _in_buf, _rgb_buf, _use_opencl, _saved_opencv_threads, \
+        _saved_use_opencl
     if pose:
         pose.close()
         pose = None
+    if pose_landmarker:
+        pose_landmarker.close()
+        pose_landmarker = None
+    onnx_session = None
+    _in_buf = None
+    _rgb_buf = None
+    # Give OpenCV's process-wide settings back to the other actors in this interpreter
+    if _saved_opencv_threads is not None:
+        cv2.setNumThreads(_saved_opencv_threads)
+        _saved_opencv_threads = None
+    if _saved_use_opencl is not None:
+        cv2.ocl.setUseOpenCL(_saved_use_opencl)
+        _saved_use_opencl = None
+    _use_opencl = False
+    _reset_cache()
     return
 
+def _capture_loop(cap, frames, stop_event):
+    """
+    Reads frames from an OpenCV capture device until stop_event is set, keeping only
+    the most recent frame in the size-1 frames queue so the consumer never processes stale images.
+
+    :param cap: An opened OpenCV video capture device.
+    :type cap: cv2.VideoCapture
+    :param frames: Queue with maxsize=1 receiving the latest captured frame.
+    :type frames: queue.Queue
+    :param stop_event: Event signalling the loop to exit.
+    :type stop_event: threading.Event
+    :return: None
+    :rtype: None
+    """
+    while not stop_event.is_set():
+        ret, frame = cap.read()
+        if not ret or frame is None:
+            stop_event.wait(0.01)  # Back off briefly so a failing camera doesn't spin a core
+            continue
+        try:
+            frames.put(frame, block=False)
+        except queue.Full:
+            # Drop the frame the consumer has not picked up yet and replace it with the newer one
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+            frames.put(frame, block=False)
+
 if __name__ == "__main__":
     """ 
     This section is used to call the python_main() function from an IDE
@@ -175,22 +584,38 @@ if __name__ == "__main__":
     if not cap.isOpened():
         print("Error: Could not open video stream.")
     else:
+        frames = queue.Queue(maxsize=1)
+        stop_event = threading.Event()
+        # Frames are captured on a background thread, so waiting on the camera overlaps with pose detection
+        capture_thread = threading.Thread(target=_capture_loop, args=(cap, frames, stop_event), daemon=True)
+        # Output is written as bytes in one call per frame and flushed every few frames,
+        # so console I/O adds as little as possible to the measured frame time.
+        out = sys.stdout.buffer
+        flush_every_n_frames = 30
+        frame_count = 0
         try:
             python_init(None)  # Initialize MediaPipe Pose
+            capture_thread.start()
             while True:
-                # Below, reading the capured video frame returns two values, the first 'ret' allows us to know true/false for the success of the capture
-                # the second 'frame' value contains the image data if available.
-                ret, frame = cap.read()
-                if not ret or frame is None:
-                    print("Status: No valid frame received")
+                try:
+                    frame = frames.get(timeout=1.0)
+                except queue.Empty:
+                    out.write(b"Status: No valid frame received\n")
+                    out.flush()  # Show stalls right away instead of waiting for the next batch flush
                     continue
                 # python_main() defined above, returns two values, first the POSE json data if available, and second a status message
                 output_json, status_message = python_main(frame)
                 # we print these values so that we can see the output, similarly to how they would be output from Pythoner.
-                print(output_json)
-                print("Status:", status_message)
+                out.write(output_json.encode() + b"\nStatus: " + status_message.encode() + b"\n")
+                frame_count += 1
+                if frame_count % flush_every_n_frames == 0:
+                    out.flush()
         except KeyboardInterrupt:
             pass  # Stop on user interrupt (Ctrl+C)
         finally:
+            out.flush()
+            stop_event.set()
+            if capture_thread.is_alive():
+                capture_thread.join(timeout=1.0)  # Don't hang if cap.read() is stuck on a stalled camera
             cap.release()
             python_finalize()